@@ -32,6 +32,35 @@ if __name__ == "__main__":
     controller = InterfaceController(model, view)
     # Capacity and File Name can be set here
 
+    def enter_car_park():
+        registration_number = view.get_input("Please enter the vehicle's registration: ")
+        controller.handle_enter_car_park(registration_number)
+
+    def exit_car_park():
+        registration_exit = view.get_input("Please enter the vehicle's registration: ")
+        controller.handle_exit_car_park(registration_exit)
+
+    def query_parking_record():
+        ticket_number = view.get_input("Please enter the ticket number to query: ")
+        controller.handle_query_parking_record(ticket_number)
+
+    def quit_car_park():
+        view.display_message("\nThank you for parking with us. Goodbye.")
+        return True
+
+    def invalid_option():
+        view.display_message("\nInvalid option. Please select a valid option.")
+
+    menu_options = {
+        "1": enter_car_park,
+        "2": exit_car_park,
+        "3": controller.handle_view_parking_spaces,
+        "4": query_parking_record,
+        "5": quit_car_park,
+    }
+    # Each menu option maps to a function that prompts for any input it needs and passes it to the controller.
+    # Only quit_car_park returns True, which ends the program.
+
     while True:
         print(f"\nWelcome to the Car Park. At any stage, enter '0' to go back to the main menu.")
         print("\n1. Enter the car park (Hourly rate: £2)")
@@ -42,20 +71,6 @@ if __name__ == "__main__":
 
         user_input = view.get_input("\nPlease enter your choice: ")
 
-        if user_input == "1":
-            registration_number = view.get_input("Please enter the vehicle's registration: ")
-            controller.handle_enter_car_park(registration_number)
-        elif user_input == "2":
-            registration_exit = view.get_input("Please enter the vehicle's registration: ")
-            controller.handle_exit_car_park(registration_exit)
-        elif user_input == "3":
-            controller.handle_view_parking_spaces()
-        elif user_input == "4":
-            ticket_number = view.get_input("Please enter the ticket number to query: ")
-            controller.handle_query_parking_record(ticket_number)
-        elif user_input == "5":
-            view.display_message("\nThank you for parking with us. Goodbye.")
+        if menu_options.get(user_input, invalid_option)():
             break
-        else:
-            view.display_message("\nInvalid option. Please select a valid option.")
-    # Presents options to the user and handles the user input.
+    # Presents options to the user and looks up the chosen option in menu_options, falling back to invalid_option.
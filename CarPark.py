@@ -17,66 +17,93 @@ decoupled design, isolating changes and failures to individual components. Perfo
 component via the use of binary search and indexing.
 """
 
+import bisect
 import csv
-import time
+import functools
+import io
+import itertools
 import random
 import re
 from datetime import datetime
 
+_REG_RE = re.compile(r'^[A-Z]{2}[0-9]{2}\s[A-Z]{3}\Z')
+# UK registration number format, compiled once when the module loads rather than on every entry attempt. \Z is used
+# instead of $ so a trailing newline is not accepted.
+
+_TIME_FORMAT = "%H:%M:%S %Y-%m-%d"
+_CSV_FIELDS = 6
+# Format of the entry and exit times stored in the data file, and the number of columns saved for each record.
+# In memory, each record has two extra slots that are never written to the file: [6] holds the parsed entry time and
+# [7] holds the normalised registration number used as its search key.
+
+
+def _now_pair():
+    now = datetime.now().replace(microsecond=0)
+    return now, (f"{now.hour:02d}:{now.minute:02d}:{now.second:02d} "
+                 f"{now.year:04d}-{now.month:02d}-{now.day:02d}")
+# Returns the current time both as a datetime (for fee calculations) and as a string in _TIME_FORMAT (for the file).
+# The string is built from the datetime's fields directly, so strftime is not called for every entry and exit.
+# Microseconds are dropped so fees match the stored strings after a restart.
+
+
+def _registration_key(registration_number):
+    return registration_number.strip().upper()
+# Normalises a registration number (uppercase, whitespace trimmed) so it can be compared with the registration index.
+
 
 """
 I have implemented a binary search for efficient data retrieval. This method significantly 
 reduces the time complexity of search operations from O(n) to O(log n), where n is the number of records in the 
 dataset. This will improve performance especially on larger datasets. I have implemented this with scalability in mind.
 
-I have a normal binary search (binary_search) for entry and querying.
-I also have adapted binary search (binary_search_latest) for exiting the car park. This is if a car (same registration)
-has entered the car park multiple times, when exits, the binary search retrieves the latest entry to avoid errors. 
+The searches run over sorted indexes that the Model keeps up to date as cars enter and exit, so the records never have
+to be re-sorted before a search. Each index is a pair of parallel lists: a flat list of keys and the matching rows. The
+bisect module (implemented in C) searches the keys list directly, so each comparison is a plain string comparison with
+no Python key function or tuple comparison involved.
+In effect, the keys list is the registration column stored on its own: a search only touches that column, and the
+full row is only fetched once a match has been found.
+
+I have an adapted binary search (binary_search_latest) for entering and exiting the car park. This is if a car (same
+registration) has entered the car park multiple times, the binary search retrieves the entry that is still parked to
+avoid errors.
 It is part of the 'Model' in my MVC architecture, but I have separated it here for clarity and single responsibility.
 """
 
 
 class BinarySearch:
     @staticmethod
-    def binary_search_helper(data_list, target_registration_number, registration_key_function, latest_search=None):
-        left, right = 0, len(data_list) - 1
-
-        while left <= right:
-            mid = (left + right) // 2
-            row = data_list[mid]
-            row_key = registration_key_function(row)
-
-            if latest_search:
-                process_result = latest_search(row, row_key, target_registration_number)
-                if process_result is not None:
-                    return process_result
-
-            if row_key < target_registration_number:
-                left = mid + 1
-            elif row_key > target_registration_number:
-                right = mid - 1
-            else:
-                return row
-
+    def binary_search_latest(index, target_key):
+        keys, rows = index
+        position = bisect.bisect_left(keys, target_key)
+
+        while position < len(keys) and keys[position] == target_key:
+            if not rows[position][4]:
+                return rows[position]
+            position += 1
         return None
-    
-    # Code for binary search with latest_search parameter that is able to accommodate further searches.
+    # Conducts a binary search that returns the registration that has not exited yet, checking the rows with the same
+    # key in turn.
 
     @staticmethod
-    def binary_search_normal(data_list, target_registration_number, registration_key_function):
-        return BinarySearch.binary_search_helper(data_list, target_registration_number, registration_key_function)
-    # Conducts a standard binary search by calling binary_search_helper
+    def insert_into_index(index, key, row):
+        keys, rows = index
+        position = bisect.bisect_right(keys, key)
+        keys.insert(position, key)
+        rows.insert(position, row)
+    # Inserts the key and row at the same position while keeping the index sorted, so it never needs to be sorted
+    # again. Rows with the same key stay in the order they were added.
 
     @staticmethod
-    def binary_search_latest(data_list, target_registration_number, registration_key_function):
-        def latest_search(row, row_key, target):
-            if row_key == target and not row[4]:
-                return row
-            return None
-
-        return BinarySearch.binary_search_helper(data_list, target_registration_number, registration_key_function,
-                                                 latest_search)
-    # Conducts a binary search that returns the latest registration, once again by calling binary_search_helper.
+    def remove_from_index(index, key, row):
+        keys, rows = index
+        position = bisect.bisect_left(keys, key)
+        while position < len(keys) and keys[position] == key:
+            if rows[position] is row:
+                del keys[position]
+                del rows[position]
+                return
+            position += 1
+    # Locates the key for this exact row and removes both from the index.
 
 
 """
@@ -90,6 +117,7 @@ class DataHandler:
     def __init__(self, data_file):
         self.data_file = data_file
         self.file_creation_status = self.create_data_file()
+        self.read_status = None
 
     def create_data_file(self):
         try:
@@ -100,33 +128,69 @@ class DataHandler:
         # Attempts to create a new CSV file. If that file already exists it will do nothing. (Error/Exception handling)
         # Returns "created" status if a new file was created
 
-    def read_car_parking_data(self):
+    def iter_car_parking_data(self):
+        self.read_status = None
         try:
-            with open(self.data_file, "r") as file:
-                car_parking_reader = csv.reader(file)
-                return list(car_parking_reader)
+            with open(self.data_file, "r", buffering=1 << 20, newline="") as file:
+                for line in file:
+                    if '"' in line:
+                        yield from csv.reader(itertools.chain([line], file))
+                        break
+                    yield line.rstrip("\r\n").split(",")
         except FileNotFoundError:
-            return "file_not_found"
+            self.read_status = "file_not_found"
         except IOError:
-            return "io_error"
+            self.read_status = "io_error"
         except csv.Error:
-            return "csv_error"
-        # Opens and reads the data file, returning the data as a list of rows.
+            self.read_status = "csv_error"
+        # Opens the data file with a 1 MB buffer and yields one row at a time, so callers that only scan the data once
+        # never need the whole file as a list. If any errors occurs, the corresponding error message is stored in
+        # read_status once the rows run out.(Error/Exception handling)
+        # Rows written by format_row are plain comma separated values, so each line is split with str.split instead of
+        # going through csv.reader. Once a line contains a quote, that line and the rest of the file are handed to
+        # csv.reader, since a quoted field may contain commas or carry on over several lines.
+
+    def read_car_parking_data(self):
+        car_parking_data = list(self.iter_car_parking_data())
+        return self.read_status or car_parking_data
+        # Reads the data file, returning the data as a list of rows.
         # In any errors occurs, for example, it returns a corresponding error message.(Error/Exception handling)
 
+    @staticmethod
+    def format_row(data_row):
+        line = ",".join(["" if value is None else str(value) for value in data_row[:_CSV_FIELDS]])
+        if line.count(",") == _CSV_FIELDS - 1 and '"' not in line and "\n" not in line and "\r" not in line:
+            return line + "\r\n"
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(data_row[:_CSV_FIELDS])
+        return buffer.getvalue()
+    # Formats a row as one line of CSV text. Our fields (registration, ticket, space, times and fee) never contain
+    # commas, quotes or line breaks, so they are simply joined, skipping csv.writer's per-field quoting checks.
+    # A row that does contain one of those characters falls back to csv.writer so the file is never corrupted.
+    # Lines end in "\r\n", the same as csv.writer, so the file looks the same whichever way a row was written.
+
     def update_car_parking_data(self, car_parking_data):
         try:
             with open(self.data_file, "w", newline="") as update_file:
-                car_parking_update = csv.writer(update_file)
-                for data_row in car_parking_data:
-                    car_parking_update.writerow(data_row)
+                update_file.write("".join([self.format_row(data_row) for data_row in car_parking_data]))
         except IOError:
             return "io_error"
         except csv.Error:
             return "csv_error"
-        # Update existing data in data file with data from car_parking_data.
+        # Update existing data in data file with data from car_parking_data, written with a single write call.
         # Once again, if any errors occurs,it returns a corresponding error message.(Error/Exception handling)
 
+    def append_row(self, data_row):
+        try:
+            with open(self.data_file, "a", newline="", buffering=64 * 1024) as append_file:
+                append_file.write(self.format_row(data_row))
+        except IOError:
+            return "io_error"
+        except csv.Error:
+            return "csv_error"
+        # Appends a single row to the end of the data file instead of rewriting every existing row.
+        # Same error handling as update_car_parking_data. (Error/Exception handling)
+
 
 """
 Main Model class that handles functions such as allocating parking spaces, calculating parking fee and other methods. 
@@ -138,12 +202,20 @@ class Model:
     def __init__(self, capacity, data_file):
         self.capacity = capacity
         self.data_handler = DataHandler(data_file)
-        self.occupied_spaces = set()
+        self.occupied_mask = 0
+        self.full_mask = (1 << capacity) - 1
+        self.reg_index = ([], [])
+        self.reg_index_version = 0
+        self.search_parked_record = functools.lru_cache(maxsize=128)(self.search_reg_index)
+        self.ticket_index = {}
+        self.records = []
         self.parking_index()
 
     def read_car_parking_data(self):
-        return self.data_handler.read_car_parking_data()
+        car_parking_data = self.data_handler.read_car_parking_data()
+        return car_parking_data if isinstance(car_parking_data, list) else []
     # Delegates the task of reading to the file to the DataHandler class, maintaining separation of concerns.
+    # An error status is reported by the controller, so an empty list is used here instead.
 
     def update_car_parking_data(self, car_parking_data):
         self.data_handler.update_car_parking_data(car_parking_data)
@@ -153,75 +225,127 @@ class Model:
     To further increase efficiency and performance, I use an index to track occupied spaces. When the program starts, it 
     initialises the index by reading the data file ONCE. Whenever a car enters or leaves, the index will be updated 
     accordingly.The indexing improves efficiency by avoiding repeated data file iterations.
+
+    Occupied spaces are stored as a bitmap in a single integer (occupied_mask), where bit i set means space i + 1 is
+    occupied. Checking, allocating and freeing a space are then single integer operations instead of set operations.
     """
 
     def parking_index(self):
-        car_parking_data = self.read_car_parking_data()
-        for row in car_parking_data:
+        for row in self.data_handler.iter_car_parking_data():
             if not row[4]:
-                self.occupied_spaces.add(int(row[2]))
-    # If there is no exit time [4] ( the car is still parked), then it adds parking space number [2] to occupied_space
+                self.occupy_parking_space(int(row[2]))
+                try:
+                    row.append(datetime.strptime(row[3], _TIME_FORMAT))
+                except ValueError:
+                    row.append(None)
+            else:
+                row.append(None)
+            row.append(_registration_key(row[0]))
+            self.records.append(row)
+            self.add_record_to_index(row)
+        if self.data_handler.read_status:
+            self.records = []
+            self.reg_index = ([], [])
+            self.reg_index_version += 1
+            self.ticket_index = {}
+            self.occupied_mask = 0
+    # Streams the rows from the data file in a single pass, building the in-memory records as it goes.
+    # If there is no exit time [4] ( the car is still parked), then it marks parking space number [2] as occupied
+    # and parses its entry time [3] once, caching it in [6] for every later fee calculation. A malformed entry time is
+    # left unparsed, so one bad row does not stop the program starting; the error is raised when that car's fee is
+    # first needed, and is reported there by the controller.
+    # The registration number [0] is normalised once and cached in [7] as the record's search key.
+    # Adds every record to the search indexes. If the file could not be read, the partially read data is discarded, and
+    # the controller refuses entries and exits so the incomplete records are never written over the file.
+
+    def add_record_to_index(self, row):
+        indexed_row = self.ticket_index.get(row[1])
+        if indexed_row is None or not row[4] or indexed_row[4]:
+            self.ticket_index[row[1]] = row
+        if not row[4]:
+            BinarySearch.insert_into_index(self.reg_index, row[7], row)
+            self.reg_index_version += 1
+    # Every record is searchable by ticket number [1]. If a ticket number is repeated, a car that is still parked keeps
+    # it; otherwise the latest record does.
+    # Only cars that are still parked are kept in the registration index, keyed by the normalised registration
+    # number [7].
+
+    def remove_parked_record(self, row):
+        BinarySearch.remove_from_index(self.reg_index, row[7], row)
+        self.reg_index_version += 1
+    # Removes a car from the registration index once it has exited the car park.
+    # Every change to the registration index bumps reg_index_version, so cached searches from before are never reused.
 
     def parking_availability(self):
-        return self.capacity - len(self.occupied_spaces)
-    # Subtracts occupied spaces from capacity to find how many spaces are available
+        return self.capacity - bin(self.occupied_mask).count("1")
+    # Subtracts the number of occupied bits from capacity to find how many spaces are available
     # It does NOT represent WHICH specific spaces are available
 
     def allocate_parking_space(self):
-        available_spaces = set(range(1, self.capacity + 1)) - self.occupied_spaces
-        return min(available_spaces) if available_spaces else None
+        free_mask = ~self.occupied_mask & self.full_mask
+        return (free_mask & -free_mask).bit_length() if free_mask else None
     # Finds which specific spaces are available for new cars.
-    # Creates a set of parking spaces from 1 to car park capacity and subtracts that from occupied spaces.
-    # returns the space with the smallest number.
+    # free_mask & -free_mask keeps only the lowest free bit, and its bit_length is that space's number, so the space
+    # with the smallest number is returned without building a set of every space in the car park.
+
+    def occupy_parking_space(self, parking_space):
+        self.occupied_mask |= 1 << (parking_space - 1)
+    # Marks a space as occupied by setting its bit.
+
+    def release_parking_space(self, parking_space):
+        self.occupied_mask &= ~(1 << (parking_space - 1))
+    # Marks a space as free again by clearing its bit once the car parked there has exited.
 
-    def parking_fee(self, entry_time, exit_time):
-        entry_datetime = datetime.strptime(entry_time, "%H:%M:%S %Y-%m-%d")
-        exit_datetime = datetime.strptime(exit_time, "%H:%M:%S %Y-%m-%d")
+    def parking_fee(self, entry_datetime, exit_datetime):
         time_difference = exit_datetime - entry_datetime
         hours_parked = time_difference.total_seconds() / 3600
         hourly_rate = 2
         total_fee = hours_parked * hourly_rate
         return total_fee
-    # Calculates the difference between entry and exit in hours
+    # Calculates the difference between entry and exit in hours, using datetimes that are already parsed.
     # Multiplies the parking fee (£2) by hours parked and return the total parking fee
 
-    def update_parking_data(self, registration_number, ticket_number, parking_space, entry_time):
-        car_parking_data = [registration_number, ticket_number, parking_space, entry_time, None, None]
+    def entry_datetime(self, row):
+        if row[6] is None:
+            row[6] = datetime.strptime(row[3], _TIME_FORMAT)
+        return row[6]
+    # Returns the cached entry datetime [6] of a parked record, parsing its entry time [3] if it was not parsed when
+    # the data file was read.
 
-        car_parking_data_list = self.data_handler.read_car_parking_data()
-        car_parking_data_list.append(car_parking_data)
-
-        self.data_handler.update_car_parking_data(car_parking_data_list)
+    def update_parking_data(self, registration_number, ticket_number, parking_space, entry_time, entry_datetime):
+        car_parking_data = [registration_number, ticket_number, parking_space, entry_time, None, None, entry_datetime,
+                            _registration_key(registration_number)]
+        self.records.append(car_parking_data)
+        self.add_record_to_index(car_parking_data)
+        self.data_handler.append_row(car_parking_data)
 
     # Creates a new parking record for each new car entry that includes:
     # registration number, ticket number, parking space, entry time, and placeholders for exit time and fee.
-    # Reads existing car parking data, appends the new record, and updates the data file.
-    # This ensures that the new entry is stored in the data file.
+    # The entry datetime and normalised registration are kept alongside the record so they are never worked out again.
+    # Adds the new record to the in-memory records and appends only that row to the data file, so the existing
+    # data never has to be re-read or rewritten when a car enters.
 
     def is_already_parked(self, registration_number):
-        car_parking_data = self.read_car_parking_data()
-        car_parking_data.sort(key=lambda row: row[0].strip().upper())  # Sort by registration number
+        return self.find_parked_record(registration_number) is not None
+    # Checks if a car with a given registration number is already parked.
+    # Returns True if a parked record is found (the car has no exit time yet), otherwise False.
 
-        def get_registration(row):
-            return row[0].strip().upper()
+    def find_parked_record(self, registration_number):
+        return self.search_parked_record(_registration_key(registration_number), self.reg_index_version)
+    # Finds the record of a car that is still parked, using the registration number in uppercase, whitespace trimmed.
+    # Results are kept in a small LRU cache (the 128 most recent searches) keyed on the registration and the version
+    # of the registration index, so repeating a search before any car enters or exits does not search again.
 
-        found_record = BinarySearch.binary_search_normal(car_parking_data, registration_number.upper(),
-                                                         get_registration)
-        return found_record is not None and not found_record[4]
-    # Checks if a car with a given registration number is already parked.
-    # Reads car parking data, sorts it by registration number (in uppercase, whitespace trimmed) for binary search.
-    # Uses a binary search to find a matching registration number.
-    # Returns True if a match is found without an exit time (indicating the car is still parked), otherwise False.
+    def search_reg_index(self, registration_key, reg_index_version):
+        return BinarySearch.binary_search_latest(self.reg_index, registration_key)
+    # Uses a binary search on the registration index. The index is kept sorted as cars enter and exit, so no sorting
+    # is needed here. reg_index_version is only used as part of the cache key by find_parked_record.
 
     def find_record_by_ticket(self, ticket_number):
-        ticket_search_data = self.read_car_parking_data()
-        ticket_search_data.sort(key=lambda row: row[1])
-
-        def get_ticket(row):
-            return row[1]
-        return BinarySearch.binary_search_normal(ticket_search_data, ticket_number, get_ticket)
+        return self.ticket_index.get(ticket_number)
     # Finds a parking record based on given ticket number.
-    # Data is sorted by ticker number [1] and a binary search is performed.
+    # Ticket queries only ever need an exact match, so the ticket index is a dictionary keyed by ticket number [1],
+    # giving an O(1) lookup instead of an O(log n) search.
     # If a matching ticket number is found, the data in the row is returned.
 
 
@@ -239,15 +363,19 @@ class BaseController:
 
     """
     start_car_entry_process: Handles the process for a vehicle entering the car park. Registration number is checked for
-    using "binary_search_normal" and the process outputs variable statuses depending on outcome. 
+    using "binary_search_latest" and the process outputs variable statuses depending on outcome. 
+    The registration number arrives already validated and in uppercase from car_entry_reg_check.
     """
     
     def start_car_entry_process(self, registration_number):
-        if len(self.model.occupied_spaces) >= self.model.capacity:
+        if self.model.data_handler.read_status:
+            return "data_unavailable", None
+    # Checks that the data file was read successfully, as no car can be parked if its record cannot be saved safely.
+
+        if self.model.parking_availability() <= 0:
             return "full", None
-    # Compares occupied spaces with capacity to check to see if the car park is full and returns status
+    # Checks to see if the car park is full and returns status
 
-        registration_number = registration_number.upper()
         if self.model.is_already_parked(registration_number):
             return "already_parked", None
     # Checks to see if the car is already parked and returns status.
@@ -256,13 +384,14 @@ class BaseController:
     # Calls on the allocate_parking_space function to assign a parking space for the car.
 
         if parking_space is not None:
-            entry_time = time.strftime("%H:%M:%S %Y-%m-%d", time.localtime())
-            ticket_number = registration_number.upper().replace(" ", "") + str(random.randint(1000, 9999))
-            self.model.update_parking_data(registration_number, ticket_number, parking_space, entry_time)
-            self.model.occupied_spaces.add(parking_space)
+            entry_datetime, entry_time = _now_pair()
+            ticket_number = f"{registration_number.replace(' ', '')}{random.randint(1000, 9999)}"
+            self.model.update_parking_data(registration_number, ticket_number, parking_space, entry_time,
+                                           entry_datetime)
+            self.model.occupy_parking_space(parking_space)
             return "entry_success", (parking_space, ticket_number)
     # After successfully assigning a parking space: entry time is recorded, ticket number is generated, parking data
-    # is updated and assigned parking space is added to "occupied_spaces".
+    # is updated and assigned parking space is marked as occupied.
         else:
             return "full", None
     # Returns status based on outcome.
@@ -274,16 +403,18 @@ class BaseController:
         if self.model.parking_availability() <= 0:
             return "full", None
 
-        pattern = r'^[A-Z]{2}[0-9]{2}\s[A-Z]{3}$'
-        if not re.match(pattern, registration_number.upper()):
+        registration_number = registration_number.upper()
+        if not _REG_RE.match(registration_number):
             return "invalid_registration", None
         return self.start_car_entry_process(registration_number)
     # Checks for empty registration and parking availability.
-    # Uses a regex pattern to validate UK registration number format.
+    # Uses the precompiled regex pattern to validate UK registration number format.
     # Returns status based on outcome.
 
     def car_entry_status(self, status, result, registration_number):
-        if status == 'full':
+        if status == 'data_unavailable':
+            return self.data_unavailable_message()
+        elif status == 'full':
             return "Sorry, the car park is at maximum capacity currently."
         elif status == 'invalid_registration':
             return "Invalid registration number. Please enter a valid UK registration number. For example: LM55 TCU"
@@ -312,25 +443,29 @@ class BaseController:
     for using "binary_search_latest" and this process also outputs variable statuses depending on outcome. 
     """
 
-    def start_car_exit_process(self, registration_exit, car_parking_data):
-        registration_exit = registration_exit.strip().upper()
-        sorted_data_for_search = sorted(car_parking_data, key=lambda row: row[0].strip().upper())
-        found_record = BinarySearch.binary_search_latest(sorted_data_for_search, registration_exit,
-                                                         lambda row: row[0].strip().upper())
+    def start_car_exit_process(self, registration_exit):
+        if self.model.data_handler.read_status:
+            return "data_unavailable", None, None
+        # If the data file could not be read, the records in memory are incomplete, so saving them would overwrite the
+        # existing data. Returns outcome status without changing anything.
+        found_record = self.model.find_parked_record(registration_exit)
         if found_record:
-            entry_time = found_record[3]
-            exit_time = time.strftime("%H:%M:%S %Y-%m-%d", time.localtime())
-            parking_charge = self.model.parking_fee(entry_time, exit_time)
+            exit_datetime, exit_time = _now_pair()
+            parking_charge = self.model.parking_fee(self.model.entry_datetime(found_record), exit_datetime)
             found_record[4] = exit_time
             found_record[5] = "{:.2f}".format(parking_charge)
-            self.model.update_car_parking_data(car_parking_data)
+            self.model.update_car_parking_data(self.model.records)
             parking_space = int(found_record[2])
-            self.model.occupied_spaces.remove(parking_space)
+            self.model.release_parking_space(parking_space)
+            self.model.remove_parked_record(found_record)
             return "exit_success", found_record, parking_charge
-            # If car is still parked, Entry time is retrieved from the record and current time is now the exit time.
+            # If car is still parked, the cached entry datetime is retrieved from the record and current time is now
+            # the exit time.
             # Parking charge is calculated using the entry time and exit time
-            # Parking record is updated with the exit time and parking charge (2 decimal places)
-            # Parking space will be removed so that another car can use it. Returns outcome status.
+            # Parking record is updated with the exit time and parking charge (2 decimal places) and all in-memory
+            # records are saved to the file
+            # Parking space will be removed so that another car can use it, and the car is removed from the
+            # registration index. Returns outcome status.
         else:
             return "not_parked", None, None
         # If no matching record is found, returns outcome status.
@@ -340,14 +475,14 @@ class BaseController:
         if not registration_exit.strip():
             exit_message = "No registration number entered. Please enter a registration number to leave the Car Park."
         else:
-            car_parking_data = self.model.read_car_parking_data()
-            status, vehicle_record, parking_charge = self.start_car_exit_process(registration_exit, car_parking_data)
+            status, vehicle_record, parking_charge = self.start_car_exit_process(registration_exit)
             if status == "exit_success":
-                self.model.update_car_parking_data(car_parking_data)
                 available_spaces_message = self.view_available_parking()
                 exit_message = self.car_exit_confirmation(vehicle_record, parking_charge, available_spaces_message)
             elif status == "not_parked":
                 exit_message = f"No vehicle with registration {registration_exit} is currently parked"
+            elif status == "data_unavailable":
+                exit_message = self.data_unavailable_message()
         return exit_message
     # Checks to see if registration number is entered (not empty value or white space)
     # Returns appropriate response based on the status received from the whole car exit process.
@@ -385,9 +520,7 @@ class BaseController:
                 message += f"\nCar has exited the car park at {found_record[4]}"
                 message += f"\nTotal Parking fee: £{found_record[5]}"
             else:
-                current_time = datetime.now()
-                exit_time = current_time.strftime("%H:%M:%S %Y-%m-%d")
-                parking_charge = self.model.parking_fee(found_record[3], exit_time)
+                parking_charge = self.model.parking_fee(self.model.entry_datetime(found_record), _now_pair()[0])
                 message += f"\nCar is currently parked in parking space {found_record[2]}"
                 message += f"\nCurrent cost of parking is: £{parking_charge:.2f}"
             return message
@@ -405,7 +538,7 @@ class BaseController:
     # Retrieves file creation status from DataHandler and returns a message if a new file was created.
 
     def read_car_parking_data_status(self):
-        status = self.model.data_handler.read_car_parking_data()
+        status = self.model.data_handler.read_status
         if status == "file_not_found":
             return "The CSV file could not be located. Please ensure that the file exists and the file path is correct."
         elif status == "io_error":
@@ -416,6 +549,12 @@ class BaseController:
                     "for any formatting issues or invalid data entries.")
         return None
     # Retrieves status of reading data file from DataHandler and returns associated message
+    # The status is recorded when the Model first reads the file, so the file is not read a second time.
+
+    def data_unavailable_message(self):
+        return ("The parking data could not be read, so cars cannot enter or exit the car park. Please fix the data "
+                "file and restart the program.")
+    # Returned instead of an entry or exit confirmation while the data file could not be read.
 
     """
     The InterfaceController class extends the BaseController to handle specific user interactions for the car park 
@@ -1,53 +1,116 @@
 import csv
+import itertools
+import os
 import time
-import random
 from datetime import datetime
 
+# 1 MB file buffer, so reading or rewriting a large CSV takes far fewer read/write system calls.
+_BUFFER_SIZE = 1 << 20
+_NORMALIZE_TABLE = str.maketrans("", "", " \t\n\r")
 
-class BinarySearchTreeNode:
-    @staticmethod
-    def binary_search(data_list, target, key_function):
-        left, right = 0, len(data_list) - 1
 
-        while left <= right:
-            mid = (left + right) // 2
-            row = data_list[mid]
+def _canon(registration_number):
+    # Removes all whitespace in one pass with str.translate, then uppercases. Used for every registration key.
+    return registration_number.translate(_NORMALIZE_TABLE).upper()
 
-            if key_function(row) == target:
-                return row
-            elif key_function(row) < target:
-                left = mid + 1
-            else:
-                right = mid - 1
 
-        return None
+def _parse_epoch(time_text):
+    # Parses "%H:%M:%S %Y-%m-%d" by slicing the fixed positions, which is much faster than datetime.strptime.
+    if len(time_text) != 19:
+        return int(datetime.strptime(time_text, "%H:%M:%S %Y-%m-%d").timestamp())
+    return int(datetime(int(time_text[9:13]), int(time_text[14:16]), int(time_text[17:19]),
+                        int(time_text[0:2]), int(time_text[3:5]), int(time_text[6:8])).timestamp())
 
 
 class DataHandler:
     def __init__(self, data_file):
         self.data_file = data_file
+        self._cache = None
+        self._fingerprint = None
+
+    def _file_fingerprint(self):
+        file_stat = os.stat(self.data_file)
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    @staticmethod
+    def _as_read_back(data_row):
+        # The row as csv.reader would return it from the file, e.g. None becomes "".
+        return ["" if value is None else str(value) for value in data_row]
 
     def read_car_parking_data(self):
         try:
-            with open(self.data_file, "r") as file:
-                car_parking_reader = csv.reader(file)
-                return list(car_parking_reader)
+            fingerprint = self._file_fingerprint()
+            if fingerprint != self._fingerprint:
+                with open(self.data_file, "r", buffering=_BUFFER_SIZE) as file:
+                    car_parking_reader = csv.reader(file)
+                    self._cache = list(car_parking_reader)
+                self._fingerprint = fingerprint
+            # Rows are copied because callers update them in place before writing them back.
+            return [list(row) for row in self._cache]
         except FileNotFoundError:
             print(f"Error: The file {self.data_file} was not found.")
             return []
 
+    def iter_rows(self):
+        # Yields rows one at a time without building a list. Rows must not be modified, as they may be the cached rows.
+        try:
+            if self._fingerprint == self._file_fingerprint():
+                yield from self._cache
+                return
+            with open(self.data_file, "r", buffering=_BUFFER_SIZE) as file:
+                yield from csv.reader(file)
+        except FileNotFoundError:
+            print(f"Error: The file {self.data_file} was not found.")
+
     def update_car_parking_data(self, car_parking_data):
-        with open(self.data_file, "w", newline="") as update_file:
+        with open(self.data_file, "w", newline="", buffering=_BUFFER_SIZE) as update_file:
             car_parking_update = csv.writer(update_file)
             for data_row in car_parking_data:
                 car_parking_update.writerow(data_row)
+        self._cache = [self._as_read_back(data_row) for data_row in car_parking_data]
+        self._fingerprint = self._file_fingerprint()
+
+    def append_row(self, data_row):
+        try:
+            cache_is_current = self._fingerprint == self._file_fingerprint()
+        except FileNotFoundError:
+            cache_is_current = False
+        with open(self.data_file, "a", newline="") as append_file:
+            csv.writer(append_file).writerow(data_row)
+        if cache_is_current:
+            self._cache.append(self._as_read_back(data_row))
+            self._fingerprint = self._file_fingerprint()
 
 
 class Model:
     def __init__(self, capacity, data_file):
         self.capacity = capacity
         self.data_handler = DataHandler(data_file)
-        self.available_spaces = self.parking_availability()
+        self._occupied_slots = set()
+        # Each registration key maps to (row index, ticket number, entry epoch) for every row of that car still parked.
+        # A list is kept because the file may hold more than one parked row whose registrations share a key.
+        self._parked_rows = {}
+        self._by_ticket = {}
+        self._row_count = 0
+        largest_ticket_suffix = 0
+        for row_index, row in enumerate(self.data_handler.iter_rows()):
+            self._row_count += 1
+            self._by_ticket[row[1]] = row
+            ticket_suffix = row[1][len(row[1].rstrip("0123456789")):]
+            if ticket_suffix and int(ticket_suffix) > largest_ticket_suffix:
+                largest_ticket_suffix = int(ticket_suffix)
+            if not row[4]:
+                self._occupied_slots.add(int(row[2]))
+                try:
+                    entry_epoch = _parse_epoch(row[3])
+                except ValueError:
+                    # Left unparsed so one malformed row doesn't stop the model loading; process_exit parses it again.
+                    entry_epoch = None
+                self._parked_rows.setdefault(_canon(row[0]), []).append((row_index, row[1], entry_epoch))
+        self.available_spaces = self.capacity - len(self._occupied_slots)
+        # CarPark.py ends its tickets with a random number, so the counter starts above the largest number ending any
+        # ticket in the file. New tickets then never repeat one already stored, whichever program issued it.
+        self._ticket_counter = itertools.count(max(self._row_count, largest_ticket_suffix) + 1)
 
     def read_car_parking_data(self):
         return self.data_handler.read_car_parking_data()
@@ -56,32 +119,21 @@ class Model:
         self.data_handler.update_car_parking_data(car_parking_data)
 
     def parking_availability(self):
-        rows = self.data_handler.read_car_parking_data()
-        occupied_spaces = [row for row in rows if not row[4]]
-        return self.capacity - len(occupied_spaces)
+        # Kept up to date by process_car_entry and process_exit, so the file is never scanned again.
+        return self.available_spaces
 
     def get_occupied_slots(self):
-        rows = self.data_handler.read_car_parking_data()  # Use DataHandler
-        occupied_slots = set()
-        for row in rows:
-            if not row[4]:
-                occupied_slots.add(int(row[2]))
-        return occupied_slots
+        return set(self._occupied_slots)
 
     def allocate_parking_slot(self, occupied_slots):
-        available_slots = set(range(1, self.capacity + 1)) - occupied_slots
-
-        if available_slots:
-            slot_number = min(available_slots)
-            return slot_number
-        else:
-            return None
+        for slot_number in range(1, self.capacity + 1):
+            if slot_number not in occupied_slots:
+                return slot_number
+        return None
 
-    def parking_fee(self, entry_time, exit_time):
-        entry_datetime = datetime.strptime(entry_time, "%H:%M:%S %Y-%m-%d")
-        exit_datetime = datetime.strptime(exit_time, "%H:%M:%S %Y-%m-%d")
-        time_difference = exit_datetime - entry_datetime
-        hours_parked = time_difference.total_seconds() / 3600
+    def parking_fee(self, entry_epoch, exit_epoch):
+        # Times are epoch seconds, so no date parsing is needed.
+        hours_parked = (exit_epoch - entry_epoch) / 3600
         hourly_rate = 2
         total_fee = hours_parked * hourly_rate
         return total_fee
@@ -89,56 +141,68 @@ class Model:
     def update_parking_data(self, registration_number, ticket_number, parking_slot, entry_time):
         car_parking_data = [registration_number, ticket_number, parking_slot, entry_time, None, None]
 
-        car_parking_data_list = self.data_handler.read_car_parking_data()
-        car_parking_data_list.append(car_parking_data)
-
-        self.data_handler.update_car_parking_data(car_parking_data_list)
+        self.data_handler.append_row(car_parking_data)
+        self._row_count += 1
+        self._by_ticket[ticket_number] = car_parking_data
 
     def is_already_parked(self, registration_number):
-        car_parking_data = self.read_car_parking_data()
-        for row in car_parking_data:
-            if not row[4] and row[0].strip().upper() == registration_number.upper():
-                return True
-        return False
+        return _canon(registration_number) in self._parked_rows
 
     def process_car_entry(self, registration_number):
         if self.available_spaces <= 0:
             return "full", None
 
-        occupied_slots = self.get_occupied_slots()
         if self.is_already_parked(registration_number):
             return "already_parked", None
 
-        parking_slot = self.allocate_parking_slot(occupied_slots)
+        parking_slot = self.allocate_parking_slot(self._occupied_slots)
         if parking_slot is not None:
-            entry_time = time.strftime("%H:%M:%S %Y-%m-%d", time.localtime())
-            ticket_number = registration_number.upper().replace(" ", "") + str(random.randint(1, 99))
+            entry_epoch = int(time.time())
+            entry_time = time.strftime("%H:%M:%S %Y-%m-%d", time.localtime(entry_epoch))
+            registration_key = _canon(registration_number)
+            ticket_number = f"{registration_key}{next(self._ticket_counter):04d}"
             self.available_spaces -= 1
+            self._occupied_slots.add(parking_slot)
+            self._parked_rows.setdefault(registration_key, []).append((self._row_count, ticket_number, entry_epoch))
             self.update_parking_data(registration_number, ticket_number, parking_slot, entry_time)
             return "success", (parking_slot, ticket_number)
         else:
             return "full", None
 
-    def process_exit(self, registration_exit, car_parking_data):
-        sorted_car_parking_data = sorted(car_parking_data, key=lambda row: row[0].strip())
-
-        def get_registration(row):
-            return row[0].strip()
+    @staticmethod
+    def _is_parked_row(row, registration_key, ticket_number):
+        return _canon(row[0]) == registration_key and row[1] == ticket_number and not row[4]
 
-        found_record = BinarySearchTreeNode.binary_search(
-            sorted_car_parking_data, registration_exit, get_registration
-        )
+    def process_exit(self, registration_exit, car_parking_data):
+        registration_key = _canon(registration_exit)
+        parked_rows = self._parked_rows.get(registration_key)
+        found_record = None
+        if parked_rows:
+            row_index, ticket_number, entry_epoch = parked_rows[0]
+            if row_index < len(car_parking_data) and self._is_parked_row(car_parking_data[row_index], registration_key,
+                                                                         ticket_number):
+                found_record = car_parking_data[row_index]
+            else:
+                # The list is not in file order, so fall back to scanning it for this car's parked row.
+                found_record = next((row for row in car_parking_data
+                                     if self._is_parked_row(row, registration_key, ticket_number)), None)
 
-        if found_record and not found_record[4]:
-            entry_time = found_record[3]
+        if found_record:
+            if entry_epoch is None:
+                entry_epoch = _parse_epoch(found_record[3])
 
-            exit_time = time.strftime("%H:%M:%S %Y-%m-%d", time.localtime())
-            parking_charge = self.parking_fee(entry_time, exit_time)
+            exit_epoch = int(time.time())
+            parking_charge = self.parking_fee(entry_epoch, exit_epoch)
 
-            found_record[4] = exit_time
+            found_record[4] = time.strftime("%H:%M:%S %Y-%m-%d", time.localtime(exit_epoch))
             found_record[5] = "{:.2f}".format(parking_charge)
 
             self.available_spaces += 1
+            self._occupied_slots.discard(int(found_record[2]))
+            del parked_rows[0]
+            if not parked_rows:
+                del self._parked_rows[registration_key]
+            self._by_ticket[found_record[1]] = found_record
             return "exit_success", found_record, parking_charge  # Return necessary data
         else:
             return "not_parked", None, None
@@ -147,11 +211,5 @@ class Model:
         return self.available_spaces, self.capacity
 
     def find_record_by_ticket(self, ticket_number):
-        ticket_search_data = self.read_car_parking_data()
-        ticket_search_data.sort(key=lambda row: row[1])
-
-        def get_ticket(row):
-            return row[1]
-
-        return BinarySearchTreeNode.binary_search(ticket_search_data, ticket_number, get_ticket)
+        return self._by_ticket.get(ticket_number)
 